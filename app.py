@@ -4,16 +4,26 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import StringIO
 import csv
 import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import re
 try:
     from cot_reports import cot_year
     COT_LIBRARY_AVAILABLE = True
 except ImportError:
     COT_LIBRARY_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure page
 st.set_page_config(
@@ -23,20 +33,41 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_http_session():
+    """Shared keep-alive HTTP session with retries for CFTC and CSV downloads"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries))
+    return session
+
+# Ask CFTC for compressed responses; requests and urllib3 decompress transparently
+GZIP_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
+def _fetch_csv_data_cached(url):
+    """Download and parse CSV data; errors propagate so they are not cached"""
+    response = get_http_session().get(url, timeout=30)
+    response.raise_for_status()
+    
+    # Parse CSV data
+    data = list(csv.DictReader(StringIO(response.text)))
+    
+    if not data:
+        return None
+        
+    return pd.DataFrame(data)
+
 def fetch_csv_data(url):
     """Fetch CSV data from Google Sheets URL"""
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        # Parse CSV data
-        data = list(csv.DictReader(StringIO(response.text)))
+        df = _fetch_csv_data_cached(url)
         
-        if not data:
+        if df is None:
             st.error("No data found in the CSV file.")
             return None
             
-        return pd.DataFrame(data)
+        return df
         
     except requests.exceptions.RequestException as e:
         st.error(f"Error fetching data: {str(e)}")
@@ -45,51 +76,70 @@ def fetch_csv_data(url):
         st.error(f"Error parsing CSV data: {str(e)}")
         return None
 
+# Report types offered in the sidebar, in display order
+REPORT_TYPES = ["legacy_fut", "legacy_combined", "disaggregated_fut", "tff_fut"]
+
+# Earliest year covered by the COT reports
+FIRST_COT_YEAR = 1986
+
+# CFTC API endpoints for different report types
+CFTC_API_ENDPOINTS = {
+    'legacy_fut': '6dca-aqww.json',  # Legacy Futures Only
+    'legacy_combined': 'jun7-fc8e.json',  # Legacy Combined (Futures + Options)
+    'disaggregated_fut': 'kh3c-gbw2.json',  # Disaggregated Futures Only
+    'tff_fut': 'yw9f-hn96.json',  # Traders in Financial Futures
+}
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
+def _fetch_cftc_api_data_cached(report_type, max_records):
+    """Download COT records from the CFTC API; errors propagate so they are not cached"""
+    base_url = "https://publicreporting.cftc.gov/resource/"
+    endpoint = CFTC_API_ENDPOINTS[report_type]
+    url = f"{base_url}{endpoint}"
+    
+    # Add parameters to limit results and get recent data
+    params = {
+        '$limit': max_records,
+        '$order': 'report_date_as_yyyy_mm_dd DESC'
+    }
+    
+    response = get_http_session().get(url, params=params, headers=GZIP_HEADERS, timeout=60)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    if not data:
+        return None
+    
+    # Socrata omits null fields per record and serializes values as text, so build the
+    # schema from every record's keys rather than letting Arrow infer it from the first row
+    columns = list(dict.fromkeys(key for record in data for key in record))
+    schema = pa.schema([(col, pa.string()) for col in columns])
+    df = pa.Table.from_pylist(data, schema=schema).to_pandas(types_mapper=pd.ArrowDtype)
+    
+    # Convert date formats to match expected format  
+    if 'report_date_as_yyyy_mm_dd' in df.columns:
+        df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['report_date_as_yyyy_mm_dd']).dt.strftime('%m/%d/%Y')
+    elif 'Report_Date_as_YYYY_MM_DD' in df.columns:
+        df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['Report_Date_as_YYYY_MM_DD']).dt.strftime('%m/%d/%Y')
+    
+    # Standardize market names column
+    if 'Market_and_Exchange_Names' not in df.columns and 'market_and_exchange_names' in df.columns:
+        df['Market_and_Exchange_Names'] = df['market_and_exchange_names']
+    
+    return df
+
 def fetch_cftc_api_data(report_type='legacy_fut', max_records=5000):
     """Fetch COT data directly from CFTC API"""
     try:
-        # CFTC API endpoints for different report types
-        api_endpoints = {
-            'legacy_fut': '6dca-aqww.json',  # Legacy Futures Only
-            'legacy_combined': 'jun7-fc8e.json',  # Legacy Combined (Futures + Options)
-            'disaggregated_fut': 'kh3c-gbw2.json',  # Disaggregated Futures Only
-            'tff_fut': 'yw9f-hn96.json',  # Traders in Financial Futures
-        }
-        
-        if report_type not in api_endpoints:
+        if report_type not in CFTC_API_ENDPOINTS:
             st.error(f"Unknown report type: {report_type}")
             return None
         
-        base_url = "https://publicreporting.cftc.gov/resource/"
-        endpoint = api_endpoints[report_type]
-        url = f"{base_url}{endpoint}"
-        
-        # Add parameters to limit results and get recent data
-        params = {
-            '$limit': max_records,
-            '$order': 'report_date_as_yyyy_mm_dd DESC'
-        }
-        
-        response = requests.get(url, params=params, timeout=60)
-        response.raise_for_status()
-        
-        data = response.json()
-        if not data:
+        df = _fetch_cftc_api_data_cached(report_type, max_records)
+        if df is None:
             st.error("No data returned from CFTC API.")
             return None
         
-        df = pd.DataFrame(data)
-        
-        # Convert date formats to match expected format  
-        if 'report_date_as_yyyy_mm_dd' in df.columns:
-            df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['report_date_as_yyyy_mm_dd']).dt.strftime('%m/%d/%Y')
-        elif 'Report_Date_as_YYYY_MM_DD' in df.columns:
-            df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['Report_Date_as_YYYY_MM_DD']).dt.strftime('%m/%d/%Y')
-        
-        # Standardize market names column
-        if 'Market_and_Exchange_Names' not in df.columns and 'market_and_exchange_names' in df.columns:
-            df['Market_and_Exchange_Names'] = df['market_and_exchange_names']
-        
         return df
         
     except requests.exceptions.RequestException as e:
@@ -99,46 +149,54 @@ def fetch_cftc_api_data(report_type='legacy_fut', max_records=5000):
         st.error(f"Error processing CFTC data: {str(e)}")
         return None
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
+def _fetch_cftc_website_data_cached():
+    """Download the CFTC Legacy Combined CSV; errors propagate so they are not cached"""
+    # Direct CSV download from CFTC Legacy Combined dataset
+    url = "https://publicreporting.cftc.gov/api/views/jun7-fc8e/rows.csv?accessType=DOWNLOAD"
+    
+    # Stream the gzip-compressed CSV straight into Arrow's multi-threaded CSV reader
+    with get_http_session().get(url, headers=GZIP_HEADERS, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        df = pd.read_csv(response.raw, engine="pyarrow", dtype_backend="pyarrow")
+    
+    if df.empty:
+        return None
+    
+    # The CFTC website uses different column names, map them to standard format
+    column_mapping = {
+        'Report_Date_as_YYYY_MM_DD': 'Report_Date_as_YYYY_MM_DD',
+        'Market_and_Exchange_Names': 'Market_and_Exchange_Names',
+        'Comm_Positions_Long_All': 'Comm_Positions_Long_All',
+        'Comm_Positions_Short_All': 'Comm_Positions_Short_All',
+        'NonComm_Positions_Long_All': 'NonComm_Positions_Long_All',
+        'NonComm_Positions_Short_All': 'NonComm_Positions_Short_All',
+        'NonRept_Positions_Long_All': 'NonRept_Positions_Long_All',
+        'NonRept_Positions_Short_All': 'NonRept_Positions_Short_All'
+    }
+    
+    # Only rename columns that exist
+    existing_mapping = {k: v for k, v in column_mapping.items() if k in df.columns}
+    df = df.rename(columns=existing_mapping)
+    
+    # Convert date format from YYYY-MM-DD to MM/DD/YYYY
+    if 'Report_Date_as_YYYY_MM_DD' in df.columns:
+        df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['Report_Date_as_YYYY_MM_DD']).dt.strftime('%m/%d/%Y')
+    
+    return df
+
 def fetch_cftc_website_data():
     """Fetch COT data directly from CFTC Legacy Combined website"""
     try:
-        # Direct CSV download from CFTC Legacy Combined dataset
-        url = "https://publicreporting.cftc.gov/api/views/jun7-fc8e/rows.csv?accessType=DOWNLOAD"
-        
         st.info("Fetching data from CFTC Legacy Combined dataset...")
         
-        # Download the CSV data
-        response = requests.get(url, timeout=60)
-        response.raise_for_status()
+        df = _fetch_cftc_website_data_cached()
         
-        # Parse CSV data
-        csv_data = StringIO(response.text)
-        df = pd.read_csv(csv_data)
-        
-        if df.empty:
+        if df is None:
             st.error("No data found in CFTC website response")
             return None
         
-        # The CFTC website uses different column names, map them to standard format
-        column_mapping = {
-            'Report_Date_as_YYYY_MM_DD': 'Report_Date_as_YYYY_MM_DD',
-            'Market_and_Exchange_Names': 'Market_and_Exchange_Names',
-            'Comm_Positions_Long_All': 'Comm_Positions_Long_All',
-            'Comm_Positions_Short_All': 'Comm_Positions_Short_All',
-            'NonComm_Positions_Long_All': 'NonComm_Positions_Long_All',
-            'NonComm_Positions_Short_All': 'NonComm_Positions_Short_All',
-            'NonRept_Positions_Long_All': 'NonRept_Positions_Long_All',
-            'NonRept_Positions_Short_All': 'NonRept_Positions_Short_All'
-        }
-        
-        # Only rename columns that exist
-        existing_mapping = {k: v for k, v in column_mapping.items() if k in df.columns}
-        df = df.rename(columns=existing_mapping)
-        
-        # Convert date format from YYYY-MM-DD to MM/DD/YYYY
-        if 'Report_Date_as_YYYY_MM_DD' in df.columns:
-            df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['Report_Date_as_YYYY_MM_DD']).dt.strftime('%m/%d/%Y')
-        
         st.success(f"Successfully loaded {len(df)} records from CFTC website")
         return df
         
@@ -149,6 +207,68 @@ def fetch_cftc_website_data():
         st.error(f"Error processing CFTC website data: {str(e)}")
         return None
 
+@st.cache_resource
+def get_cot_library_lock():
+    """Serializes cot_year calls, which extract to fixed file names in the working directory"""
+    return threading.Lock()
+
+def _load_cot_library_data(year, report_type):
+    """Download a year of COT data with the cot_reports library and standardize columns"""
+    # Map report types to library parameters
+    library_report_types = {
+        'legacy_fut': 'legacy_fut',
+        'legacy_combined': 'legacy_futopt',
+        'disaggregated_fut': 'disaggregated_fut', 
+        'tff_fut': 'traders_in_financial_futures_fut'
+    }
+    
+    lib_report_type = library_report_types.get(report_type, 'legacy_fut')
+    
+    # Concurrent calls (foreground loads and prefetches) would overwrite each other's extract
+    with get_cot_library_lock():
+        df = cot_year(year=year, cot_report_type=lib_report_type)
+    
+    if df is None or df.empty:
+        return None
+    
+    # Map exact column names from the COT library output
+    column_mapping = {
+        'Market and Exchange Names': 'Market_and_Exchange_Names',
+        'As of Date in Form YYYY-MM-DD': 'Report_Date_as_YYYY_MM_DD',
+        'Commercial Positions-Long (All)': 'Comm_Positions_Long_All',
+        'Commercial Positions-Short (All)': 'Comm_Positions_Short_All',
+        'Noncommercial Positions-Long (All)': 'NonComm_Positions_Long_All',
+        'Noncommercial Positions-Short (All)': 'NonComm_Positions_Short_All',
+        'Nonreportable Positions-Long (All)': 'NonRept_Positions_Long_All',
+        'Nonreportable Positions-Short (All)': 'NonRept_Positions_Short_All'
+    }
+    
+    # Rename columns
+    df = df.rename(columns=column_mapping)
+    
+    # Convert date format from YYYY-MM-DD to MM/DD/YYYY
+    if 'Report_Date_as_YYYY_MM_DD' in df.columns:
+        df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['Report_Date_as_YYYY_MM_DD']).dt.strftime('%m/%d/%Y')
+    
+    return df
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8)
+def _fetch_cot_library_data_cached(year, report_type):
+    """Cached COT library fetch for the current year, which gains a report every week"""
+    return _load_cot_library_data(year, report_type)
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=8)
+def _fetch_cot_library_archive_cached(year, report_type):
+    """Cached COT library fetch for past years, persisted to disk since they no longer change"""
+    return _load_cot_library_data(year, report_type)
+
+def _fetch_cot_library_cached(year, report_type):
+    """Fetch through the COT library cache appropriate for the given year"""
+    # Streamlit ignores ttl on disk-persisted caches, so only completed years are persisted
+    if year < datetime.now().year:
+        return _fetch_cot_library_archive_cached(year, report_type)
+    return _fetch_cot_library_data_cached(year, report_type)
+
 def fetch_cot_library_data(year=None, report_type='legacy_fut'):
     """Fetch COT data using the cot_reports library"""
     if not COT_LIBRARY_AVAILABLE:
@@ -159,41 +279,12 @@ def fetch_cot_library_data(year=None, report_type='legacy_fut'):
         if year is None:
             year = datetime.now().year
         
-        # Map report types to library parameters
-        library_report_types = {
-            'legacy_fut': 'legacy_fut',
-            'legacy_combined': 'legacy_futopt',
-            'disaggregated_fut': 'disaggregated_fut', 
-            'tff_fut': 'traders_in_financial_futures_fut'
-        }
-        
-        lib_report_type = library_report_types.get(report_type, 'legacy_fut')
-        
-        df = cot_year(year=year, cot_report_type=lib_report_type)
+        df = _fetch_cot_library_cached(year, report_type)
         
-        if df is None or df.empty:
+        if df is None:
             st.error(f"No COT data found for year {year}")
             return None
         
-        # Map exact column names from the COT library output
-        column_mapping = {
-            'Market and Exchange Names': 'Market_and_Exchange_Names',
-            'As of Date in Form YYYY-MM-DD': 'Report_Date_as_YYYY_MM_DD',
-            'Commercial Positions-Long (All)': 'Comm_Positions_Long_All',
-            'Commercial Positions-Short (All)': 'Comm_Positions_Short_All',
-            'Noncommercial Positions-Long (All)': 'NonComm_Positions_Long_All',
-            'Noncommercial Positions-Short (All)': 'NonComm_Positions_Short_All',
-            'Nonreportable Positions-Long (All)': 'NonRept_Positions_Long_All',
-            'Nonreportable Positions-Short (All)': 'NonRept_Positions_Short_All'
-        }
-        
-        # Rename columns
-        df = df.rename(columns=column_mapping)
-        
-        # Convert date format from YYYY-MM-DD to MM/DD/YYYY
-        if 'Report_Date_as_YYYY_MM_DD' in df.columns:
-            df['Report_Date_as_MM_DD_YYYY'] = pd.to_datetime(df['Report_Date_as_YYYY_MM_DD']).dt.strftime('%m/%d/%Y')
-        
         return df
         
     except Exception as e:
@@ -201,6 +292,45 @@ def fetch_cot_library_data(year=None, report_type='legacy_fut'):
         st.error(f"Exception details: {type(e).__name__}: {str(e)}")
         return None
 
+@st.cache_resource
+def get_prefetch_executor():
+    """Shared background pool for speculative COT downloads"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="cot-prefetch")
+
+def prefetch_adjacent_cot_data(year, report_type):
+    """Warm the cache for the previous year and the next report type in the background"""
+    if not COT_LIBRARY_AVAILABLE:
+        return
+    
+    next_report_type = REPORT_TYPES[(REPORT_TYPES.index(report_type) + 1) % len(REPORT_TYPES)]
+    candidates = [(year, next_report_type)]
+    if year - 1 >= FIRST_COT_YEAR:
+        candidates.append((year - 1, report_type))
+    
+    # Failures are not cached, so an unsuccessful prefetch simply leaves the next load cold
+    executor = get_prefetch_executor()
+    for args in candidates:
+        executor.submit(_fetch_cot_library_cached, *args)
+
+COT_POSITION_COLS = [
+    'Comm_Positions_Long_All', 'Comm_Positions_Short_All',
+    'NonComm_Positions_Long_All', 'NonComm_Positions_Short_All',
+    'NonRept_Positions_Long_All', 'NonRept_Positions_Short_All'
+]
+
+# Known numeric columns of the standardized CFTC schema
+COT_NUMERIC_COLS = COT_POSITION_COLS + ['Open_Interest_All']
+
+def _hash_dataframe_sample(df):
+    """Cheap cache key for large DataFrames: shape, columns and a hash of the first and last rows"""
+    sample = pd.concat([df.head(50), df.tail(50)])
+    return (
+        tuple(df.columns),
+        len(df),
+        pd.util.hash_pandas_object(sample, index=False).values.tobytes()
+    )
+
+@st.cache_data(max_entries=4, show_spinner="Cleaning…", hash_funcs={pd.DataFrame: _hash_dataframe_sample})
 def clean_and_convert_data(df):
     """Clean and convert data types"""
     df_clean = df.copy()
@@ -208,31 +338,76 @@ def clean_and_convert_data(df):
     # Remove completely empty rows
     df_clean = df_clean.dropna(how='all')
     
-    # Try to convert numeric columns
-    for col in df_clean.columns:
-        # Skip if column is already numeric
-        if pd.api.types.is_numeric_dtype(df_clean[col]):
-            continue
+    # Parse report dates once; cache=True reuses results for dates repeated across markets
+    date_col = 'Report_Date_as_MM_DD_YYYY'
+    if date_col in df_clean.columns:
+        df_clean[date_col] = pd.to_datetime(df_clean[date_col], format='%m/%d/%Y', cache=True, errors='coerce')
+    
+    known_numeric_cols = [col for col in COT_NUMERIC_COLS if col in df_clean.columns]
+    if known_numeric_cols:
+        # Known CFTC schema: convert only the allow-listed columns, no per-column inference
+        for col in known_numeric_cols:
+            series = df_clean[col]
+            if not pd.api.types.is_numeric_dtype(series):
+                cleaned_values = series.astype('string').str.replace(r'[,$%]', '', regex=True)
+                series = pd.to_numeric(cleaned_values, errors='coerce')
+            
+            # Positions are whole contract counts, so keep the smallest integer dtype that fits
+            df_clean[col] = pd.to_numeric(series, downcast='integer')
+    else:
+        # Try to convert numeric columns
+        for col in df_clean.columns:
+            # Skip if column is already numeric
+            if pd.api.types.is_numeric_dtype(df_clean[col]):
+                continue
             
-        # Try to convert to numeric
-        try:
-            # Remove common non-numeric characters
-            cleaned_values = df_clean[col].astype(str).str.replace(',', '').str.replace('$', '').str.replace('%', '')
-            numeric_series = pd.to_numeric(cleaned_values, errors='coerce')
+            # Try to convert to numeric
+            try:
+                # Skip text columns (market names, dates) whose leading values don't look numeric
+                sample = df_clean[col].dropna().head(20).astype(str)
+                if sample.str.match(r'^\s*-?[\d.,$%]+\s*$').mean() < 0.5:
+                    continue
             
-            # If more than 50% of values are numeric, convert the column
-            if numeric_series.count() / len(df_clean) > 0.5:
-                df_clean[col] = numeric_series
-        except:
-            continue
+                # Remove common non-numeric characters in a single pass
+                cleaned_values = df_clean[col].astype('string').str.replace(r'[,$%]', '', regex=True)
+                numeric_series = pd.to_numeric(cleaned_values, errors='coerce', downcast='integer')
+            
+                # If more than 50% of values are numeric, convert the column
+                if numeric_series.count() / len(df_clean) > 0.5:
+                    df_clean[col] = numeric_series
+            except:
+                continue
+    
+    # Store market names as a categorical: categories give the sorted unique markets for free
+    if 'Market_and_Exchange_Names' in df_clean.columns:
+        df_clean['Market_and_Exchange_Names'] = df_clean['Market_and_Exchange_Names'].astype('category')
+    
+    # Sort once so each market's reports form a contiguous, date-ordered block of rows
+    sort_cols = [col for col in ['Market_and_Exchange_Names', date_col] if col in df_clean.columns]
+    if 'Market_and_Exchange_Names' in sort_cols:
+        df_clean = df_clean.sort_values(sort_cols, kind='stable').reset_index(drop=True)
     
     return df_clean
 
+def _hash_dataframe_schema(df):
+    """Cache key from column names and dtypes only, for functions that never read the values"""
+    return tuple((col, str(dtype)) for col, dtype in df.dtypes.items())
+
+@st.cache_data(max_entries=8, show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe_schema})
 def get_column_types(df):
     """Categorize columns by data type"""
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-    datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+    numeric_cols, categorical_cols, datetime_cols = [], [], []
+    
+    # Single pass over the dtypes instead of one select_dtypes scan per category
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        elif pd.api.types.is_numeric_dtype(dtype):
+            numeric_cols.append(col)
+        elif dtype == object or pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            categorical_cols.append(col)
+        elif pd.api.types.is_datetime64_dtype(dtype):
+            datetime_cols.append(col)
     
     return numeric_cols, categorical_cols, datetime_cols
 
@@ -265,7 +440,12 @@ def create_line_chart(df, x_col, y_col, title):
 
 def create_scatter_plot(df, x_col, y_col, color_col, title):
     """Create an interactive scatter plot"""
-    fig = px.scatter(df, x=x_col, y=y_col, color=color_col, title=title, hover_data=df.columns)
+    # Only send a few identifying columns for hover rather than every column of the frame
+    hover_cols = [
+        col for col in ['Market_and_Exchange_Names', 'Report_Date_as_MM_DD_YYYY']
+        if col in df.columns and col not in (x_col, y_col, color_col)
+    ]
+    fig = px.scatter(df, x=x_col, y=y_col, color=color_col, title=title, hover_data=hover_cols)
     return fig
 
 def create_pie_chart(df, values_col, names_col, title):
@@ -280,98 +460,36 @@ def create_histogram(df, col, title):
     fig = px.histogram(df, x=col, title=title, nbins=30)
     return fig
 
-def create_cot_positions_chart(df, market_name):
-    """Create Commitment of Traders positions chart for specific market"""
-    # Filter data for the selected market
-    market_data = df[df['Market_and_Exchange_Names'] == market_name].copy()
-    
-    if market_data.empty:
-        return None
-    
-    # Use the specific date column
+@st.cache_data(max_entries=4, show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe_sample})
+def build_market_index(df):
+    """Map each market name to the (start, stop) row range of its reports"""
+    # clean_and_convert_data sorts by market, so each group's rows are contiguous
+    indices = df.groupby('Market_and_Exchange_Names', sort=False, observed=True).indices
+    return {market: (int(rows[0]), int(rows[-1]) + 1) for market, rows in indices.items()}
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe_sample})
+def _prep_market_frame(df, market_name, _row_range):
+    """Extract the date and position columns for one market, sorted by date"""
     date_col = 'Report_Date_as_MM_DD_YYYY'
-    if date_col not in market_data.columns:
-        st.error(f"Date column '{date_col}' not found in data")
-        return None
     
-    # Convert date column to datetime and sort
-    try:
-        market_data[date_col] = pd.to_datetime(market_data[date_col], format='%m/%d/%Y')
-        market_data = market_data.sort_values(date_col)
-    except:
-        try:
-            market_data[date_col] = pd.to_datetime(market_data[date_col])
-            market_data = market_data.sort_values(date_col)
-        except:
-            st.warning("Could not parse date column, using as-is")
-    
-    # Calculate net positions
-    required_cols = [
-        'Comm_Positions_Long_All', 'Comm_Positions_Short_All',
-        'NonComm_Positions_Long_All', 'NonComm_Positions_Short_All',
-        'NonRept_Positions_Long_All', 'NonRept_Positions_Short_All'
-    ]
+    # Slice the market's rows (the range is derived from df and market_name); rows are
+    # already date-ordered by clean_and_convert_data
+    start, stop = _row_range
+    market_data = df.iloc[start:stop][[date_col] + COT_POSITION_COLS].copy()
     
-    # Check if all required columns exist
-    missing_cols = [col for col in required_cols if col not in market_data.columns]
-    if missing_cols:
-        st.error(f"Missing required columns: {missing_cols}")
+    if market_data.empty:
         return None
     
     # Convert to numeric if not already
-    for col in required_cols:
+    for col in COT_POSITION_COLS:
         market_data[col] = pd.to_numeric(market_data[col], errors='coerce')
     
-    # Calculate net positions
-    market_data['Commercial_Net'] = market_data['Comm_Positions_Long_All'] - market_data['Comm_Positions_Short_All']
-    market_data['NonCommercial_Net'] = market_data['NonComm_Positions_Long_All'] - market_data['NonComm_Positions_Short_All']
-    market_data['NonReportable_Net'] = market_data['NonRept_Positions_Long_All'] - market_data['NonRept_Positions_Short_All']
-    
-    # Create the chart
-    fig = go.Figure()
-    
-    # Add bars for each position type
-    fig.add_trace(
-        go.Bar(
-            x=market_data[date_col],
-            y=market_data['Commercial_Net'],
-            name='Commercials',
-            marker_color='rgba(255, 0, 0, 0.7)',
-            width=pd.Timedelta(days=5).total_seconds() * 1000 if len(market_data) > 1 else None
-        )
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=market_data[date_col],
-            y=market_data['NonCommercial_Net'],
-            name='Large_Speculators',
-            marker_color='rgba(0, 0, 255, 0.7)',
-            width=pd.Timedelta(days=5).total_seconds() * 1000 if len(market_data) > 1 else None
-        )
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=market_data[date_col],
-            y=market_data['NonReportable_Net'],
-            name='Small_Speculators',
-            marker_color='rgba(255, 255, 0, 0.7)',
-            width=pd.Timedelta(days=5).total_seconds() * 1000 if len(market_data) > 1 else None
-        )
-    )
-    
-    # Add zero line
-    fig.add_hline(y=0, line_dash="solid", line_color="white", line_width=1)
-    
-    # Update layout for dark theme similar to reference
-    fig.update_layout(
-        title=dict(
-            text=f"{market_name}",
-            x=0.5,
-            xanchor='center',
-            font=dict(size=16, color='white')
-        ),
+    return market_data.reset_index(drop=True)
+
+@st.cache_resource
+def _cot_layout_template():
+    """Static dark-theme layout shared by every COT positions chart"""
+    return dict(
         plot_bgcolor='rgba(0,0,0,0.9)',
         paper_bgcolor='rgba(0,0,0,0.9)',
         font=dict(color='white'),
@@ -402,9 +520,80 @@ def create_cot_positions_chart(df, market_name):
         height=600,
         margin=dict(b=100)
     )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_fig(market_data, market_name):
+    """Build the net positions bar chart from a prepared market frame"""
+    date_col = 'Report_Date_as_MM_DD_YYYY'
+    
+    # Calculate net positions on a contiguous (N, 6) array, avoiding Series index alignment
+    positions = market_data[COT_POSITION_COLS].to_numpy(dtype=np.float32, na_value=np.nan)
+    commercial_net = positions[:, 0] - positions[:, 1]
+    noncommercial_net = positions[:, 2] - positions[:, 3]
+    nonreportable_net = positions[:, 4] - positions[:, 5]
+    
+    # Create the chart
+    fig = go.Figure()
+    
+    dates = market_data[date_col].to_numpy()
+    bar_width = pd.Timedelta(days=5).total_seconds() * 1000 if len(market_data) > 1 else None
+    hover = '%{x|%m/%d/%y}: %{y:,}'
+    
+    # Add bars for each position type
+    fig.add_bar(x=dates, y=commercial_net, name='Commercials',
+                marker_color='rgba(255, 0, 0, 0.7)', width=bar_width, hovertemplate=hover)
+    fig.add_bar(x=dates, y=noncommercial_net, name='Large_Speculators',
+                marker_color='rgba(0, 0, 255, 0.7)', width=bar_width, hovertemplate=hover)
+    fig.add_bar(x=dates, y=nonreportable_net, name='Small_Speculators',
+                marker_color='rgba(255, 255, 0, 0.7)', width=bar_width, hovertemplate=hover)
+    
+    # Add zero line
+    fig.add_hline(y=0, line_dash="solid", line_color="white", line_width=1)
+    
+    # Update layout for dark theme similar to reference
+    fig.update_layout(
+        **_cot_layout_template(),
+        title=dict(
+            text=f"{market_name}",
+            x=0.5,
+            xanchor='center',
+            font=dict(size=16, color='white')
+        )
+    )
     
     return fig
 
+@st.cache_data(max_entries=4, show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe_sample})
+def uppercase_market_names(df):
+    """Upper-cased market categories as a numpy array for vectorized substring search"""
+    # Keyed on the sampled frame hash, since hashing the full market list costs more than the search
+    return np.array(df['Market_and_Exchange_Names'].cat.categories.str.upper(), dtype=str)
+
+def create_cot_positions_chart(df, market_name, market_index):
+    """Create Commitment of Traders positions chart for specific market"""
+    # Use the specific date column
+    date_col = 'Report_Date_as_MM_DD_YYYY'
+    if date_col not in df.columns:
+        st.error(f"Date column '{date_col}' not found in data")
+        return None
+    
+    # Check if all required columns exist
+    missing_cols = [col for col in COT_POSITION_COLS if col not in df.columns]
+    if missing_cols:
+        st.error(f"Missing required columns: {missing_cols}")
+        return None
+    
+    row_range = market_index.get(market_name)
+    if row_range is None:
+        return None
+    
+    market_data = _prep_market_frame(df, market_name, row_range)
+    
+    if market_data is None:
+        return None
+    
+    return _build_fig(market_data, market_name)
+
 def main():
     pass  # Removed title section
     
@@ -420,7 +609,7 @@ def main():
     # Report type selection
     report_type = st.sidebar.selectbox(
             "Report Type:",
-            ["legacy_fut", "legacy_combined", "disaggregated_fut", "tff_fut"],
+            REPORT_TYPES,
             format_func=lambda x: {
                 "legacy_fut": "Legacy Futures Only (1986-Present)",
                 "legacy_combined": "Legacy Combined - Futures + Options (1986-Present)",
@@ -433,7 +622,7 @@ def main():
     # Year selection for COT Library
     year = st.sidebar.selectbox(
         "Year:",
-        list(range(datetime.now().year, 1985, -1)),
+        list(range(datetime.now().year, FIRST_COT_YEAR - 1, -1)),
         help="Select year for COT data"
     )
         
@@ -451,6 +640,7 @@ def main():
         with st.spinner(f"Fetching {year} {report_type} data using COT library..."):
             raw_data = fetch_cot_library_data(year, report_type)
             if raw_data is not None:
+                prefetch_adjacent_cot_data(year, report_type)
                 st.session_state.data = clean_and_convert_data(raw_data)
                 st.success(f"COT library for {year}")
     
@@ -471,7 +661,7 @@ def main():
         df = st.session_state.data
         numeric_cols, categorical_cols, datetime_cols = get_column_types(df)
         
-        filtered_df = df.copy()
+        filtered_df = df
         
         # Check if this is COT data
         is_cot_data = 'Market_and_Exchange_Names' in df.columns and any(
@@ -486,7 +676,8 @@ def main():
             # Market selection section
             
             # Market selection with search functionality
-            markets = sorted(df['Market_and_Exchange_Names'].dropna().unique())
+            markets = df['Market_and_Exchange_Names'].cat.categories.tolist()
+            market_index = build_market_index(df)
             
             # Add search functionality
             col1, col2 = st.columns([3, 1])
@@ -505,7 +696,8 @@ def main():
             
             # Filter markets based on search
             if search_term:
-                filtered_markets = [m for m in markets if search_term.upper() in m.upper()]
+                matches = np.char.find(uppercase_market_names(df), search_term.upper()) >= 0
+                filtered_markets = [markets[i] for i in np.flatnonzero(matches)]
                 if not filtered_markets:
                     st.warning(f"No markets found containing '{search_term}'. Showing all markets.")
                     filtered_markets = markets
@@ -520,7 +712,7 @@ def main():
             )
             
             if selected_market:
-                cot_fig = create_cot_positions_chart(filtered_df, selected_market)
+                cot_fig = create_cot_positions_chart(filtered_df, selected_market, market_index)
                 if cot_fig:
                     st.plotly_chart(cot_fig, use_container_width=True)
                     
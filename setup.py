@@ -19,7 +19,9 @@ def install_requirements():
         "plotly>=6.2.0",
         "requests>=2.32.4",
         "numpy>=2.3.2",
-        "cot-reports>=0.1.3"
+        "cot-reports>=0.1.3",
+        "pyarrow>=14.0.0",
+        "orjson>=3.10.0"
     ]
     
     for requirement in requirements: